@@ -149,6 +149,12 @@ def build_parser() -> argparse.ArgumentParser:
     ocr_parser.add_argument(
         "--skip-existing", action="store_true", help="Skip columns already OCRed"
     )
+    ocr_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of columns to OCR in parallel",
+    )
     ocr_parser.add_argument(
         "--no-progress", action="store_true", help="Disable the progress bar"
     )
@@ -386,6 +392,7 @@ def cmd_ocr(args: argparse.Namespace) -> None:
         tessdata_dir=args.tessdata_dir,
         skip_existing=args.skip_existing,
         no_progress=args.no_progress,
+        jobs=args.jobs,
     )
 
 
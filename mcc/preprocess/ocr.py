@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import csv
+import os
 import re
 import shutil
 import subprocess
 import tempfile
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from statistics import median
 
@@ -38,6 +41,10 @@ except AttributeError:  # Pillow < 9
     RESAMPLE_BICUBIC = Image.BICUBIC
 
 
+class TesseractMissingError(SystemExit):
+    """Tesseract or the requested language data is not installed."""
+
+
 @dataclass
 class LineInfo:
     top: int
@@ -82,7 +89,7 @@ def list_column_images(in_dir: Path) -> list[tuple[int, int, Path]]:
 def ensure_tesseract() -> str:
     tesseract = shutil.which("tesseract")
     if not tesseract:
-        raise SystemExit(
+        raise TesseractMissingError(
             "Missing dependency tesseract. Install it and ensure it is on your PATH."
         )
     return tesseract
@@ -108,7 +115,7 @@ def validate_languages(
     missing = [token for token in lang.split("+") if token and token not in languages]
     if missing:
         missing_list = ", ".join(missing)
-        raise SystemExit(
+        raise TesseractMissingError(
             "Missing Tesseract language data: "
             f"{missing_list}. Install the data or set --tessdata-dir."
         )
@@ -123,6 +130,7 @@ def run_tesseract(
     tessdata_dir: Path | None,
     output_format: str | None,
     config: list[str] | None,
+    env: dict[str, str] | None = None,
 ) -> str:
     cmd: list[str] = [
         tesseract_cmd,
@@ -146,7 +154,9 @@ def run_tesseract(
         cmd.append(output_format)
 
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        result = subprocess.run(
+            cmd, check=True, capture_output=True, text=True, env=env
+        )
     except subprocess.CalledProcessError as exc:
         details = exc.stderr.strip() if exc.stderr else str(exc)
         raise SystemExit(f"Tesseract failed for {image_path.name}: {details}") from exc
@@ -162,6 +172,7 @@ def run_tesseract_text(
     oem: int | None,
     tessdata_dir: Path | None,
     config: list[str] | None = None,
+    env: dict[str, str] | None = None,
 ) -> str:
     return run_tesseract(
         tesseract_cmd=tesseract_cmd,
@@ -172,6 +183,7 @@ def run_tesseract_text(
         tessdata_dir=tessdata_dir,
         output_format=None,
         config=config,
+        env=env,
     )
 
 
@@ -183,6 +195,7 @@ def run_tesseract_tsv(
     oem: int | None,
     tessdata_dir: Path | None,
     config: list[str] | None = None,
+    env: dict[str, str] | None = None,
 ) -> str:
     return run_tesseract(
         tesseract_cmd=tesseract_cmd,
@@ -193,6 +206,7 @@ def run_tesseract_tsv(
         tessdata_dir=tessdata_dir,
         output_format="tsv",
         config=config,
+        env=env,
     )
 
 
@@ -351,6 +365,7 @@ def ocr_row_text(
     tessdata_dir: Path | None,
     config: list[str] | None,
     scale: int = 2,
+    env: dict[str, str] | None = None,
 ) -> str:
     if row.bottom <= row.top:
         return ""
@@ -370,14 +385,88 @@ def ocr_row_text(
             oem=oem,
             tessdata_dir=tessdata_dir,
             config=config,
+            env=env,
         )
 
 
 def write_rank_word_csv(rows: list[tuple[str, str]], csv_path: Path) -> None:
     with csv_path.open("w", newline="", encoding="utf-8") as csv_file:
-        writer = csv.writer(csv_file)
-        for rank, word in rows:
-            writer.writerow([rank, word])
+        csv.writer(csv_file).writerows(rows)
+
+
+def _single_thread_env() -> dict[str, str]:
+    # Tesseract's LSTM uses OpenMP threads; with several columns running at
+    # once that oversubscribes the CPU, so each tesseract gets one thread
+    # unless the caller already chose a limit.
+    env = dict(os.environ)
+    env.setdefault("OMP_THREAD_LIMIT", "1")
+    return env
+
+
+def ocr_column_image(
+    tesseract_cmd: str,
+    path: Path,
+    lang: str,
+    psm: int,
+    oem: int | None,
+    tessdata_dir: Path | None,
+    env: dict[str, str] | None = None,
+) -> list[tuple[str, str]]:
+    tsv_text = run_tesseract_tsv(
+        tesseract_cmd=tesseract_cmd,
+        image_path=path,
+        lang=lang,
+        psm=psm,
+        oem=oem,
+        tessdata_dir=tessdata_dir,
+        config=_TESSERACT_CONFIG,
+        env=env,
+    )
+    lines = parse_tesseract_lines(tsv_text)
+    rows: list[tuple[str, str]] = []
+
+    if lines:
+        with Image.open(path) as image:
+            row_slices = build_row_slices(lines, image.height)
+            if row_slices:
+                word_lang = strip_english_lang(lang)
+                row_texts: list[str] = []
+                words: list[str] = []
+                for row in row_slices:
+                    row_text = row.text
+                    word = extract_word(row_text)
+                    if not word:
+                        fallback_text = ocr_row_text(
+                            tesseract_cmd=tesseract_cmd,
+                            image=image,
+                            row=row,
+                            lang=word_lang,
+                            oem=oem,
+                            tessdata_dir=tessdata_dir,
+                            config=_TESSERACT_CONFIG,
+                            env=env,
+                        ).strip()
+                        if fallback_text:
+                            row_text = fallback_text
+                            word = extract_word(fallback_text)
+                    row_texts.append(row_text)
+                    words.append(word)
+                ranks = build_rank_sequence(row_texts)
+                rows = list(zip(ranks, words))
+
+    if not rows:
+        text = run_tesseract_text(
+            tesseract_cmd=tesseract_cmd,
+            image_path=path,
+            lang=lang,
+            psm=psm,
+            oem=oem,
+            tessdata_dir=tessdata_dir,
+            config=_TESSERACT_CONFIG,
+            env=env,
+        )
+        rows = parse_ocr_text(text)
+    return rows
 
 
 def ocr_columns(
@@ -391,6 +480,7 @@ def ocr_columns(
     tessdata_dir: Path | None,
     skip_existing: bool,
     no_progress: bool,
+    jobs: int = 1,
 ) -> None:
     console = Console(stderr=True)
     items = list_column_images(in_dir)
@@ -411,77 +501,34 @@ def ocr_columns(
         raise SystemExit(f"No column images in range {start_page}-{end_page}.")
 
     out_dir.mkdir(parents=True, exist_ok=True)
-    tesseract_cmd: str | None = None
-    langs_checked = False
-
-    def get_tesseract() -> str:
-        nonlocal tesseract_cmd, langs_checked
-        if tesseract_cmd is None:
-            tesseract_cmd = ensure_tesseract()
-        if not langs_checked:
-            validate_languages(tesseract_cmd, lang=lang, tessdata_dir=tessdata_dir)
-            langs_checked = True
-        return tesseract_cmd
-
-    def process_one(page_num: int, col_num: int, path: Path) -> None:
-        csv_path = out_dir / f"page-{page_num:04d}-col-{col_num}.csv"
 
+    pending: list[tuple[int, int, Path, Path]] = []
+    for page_num, col_num, path in selected:
+        csv_path = out_dir / f"page-{page_num:04d}-col-{col_num}.csv"
         if skip_existing and csv_path.exists():
             console.log(f"Skip page {page_num} col {col_num} (CSV exists)")
-            return
+            continue
+        pending.append((page_num, col_num, path, csv_path))
+    if not pending:
+        console.log(f"Wrote OCR CSV for pages {start_page}-{end_page} to {out_dir}")
+        return
 
-        tesseract_cmd = get_tesseract()
-        tsv_text = run_tesseract_tsv(
-            tesseract_cmd=tesseract_cmd,
-            image_path=path,
-            lang=lang,
-            psm=psm,
-            oem=oem,
-            tessdata_dir=tessdata_dir,
-            config=_TESSERACT_CONFIG,
-        )
-        lines = parse_tesseract_lines(tsv_text)
-        rows: list[tuple[str, str]] = []
-
-        if lines:
-            with Image.open(path) as image:
-                row_slices = build_row_slices(lines, image.height)
-                if row_slices:
-                    word_lang = strip_english_lang(lang)
-                    row_texts: list[str] = []
-                    words: list[str] = []
-                    for row in row_slices:
-                        row_text = row.text
-                        word = extract_word(row_text)
-                        if not word:
-                            fallback_text = ocr_row_text(
-                                tesseract_cmd=tesseract_cmd,
-                                image=image,
-                                row=row,
-                                lang=word_lang,
-                                oem=oem,
-                                tessdata_dir=tessdata_dir,
-                                config=_TESSERACT_CONFIG,
-                            ).strip()
-                            if fallback_text:
-                                row_text = fallback_text
-                                word = extract_word(fallback_text)
-                        row_texts.append(row_text)
-                        words.append(word)
-                    ranks = build_rank_sequence(row_texts)
-                    rows = list(zip(ranks, words))
+    tesseract_cmd = ensure_tesseract()
+    validate_languages(tesseract_cmd, lang=lang, tessdata_dir=tessdata_dir)
+    parallel = jobs > 1 and len(pending) > 1
+    ocr_one = partial(
+        ocr_column_image,
+        tesseract_cmd,
+        lang=lang,
+        psm=psm,
+        oem=oem,
+        tessdata_dir=tessdata_dir,
+        env=_single_thread_env() if parallel else None,
+    )
 
-        if not rows:
-            text = run_tesseract_text(
-                tesseract_cmd=tesseract_cmd,
-                image_path=path,
-                lang=lang,
-                psm=psm,
-                oem=oem,
-                tessdata_dir=tessdata_dir,
-                config=_TESSERACT_CONFIG,
-            )
-            rows = parse_ocr_text(text)
+    def finish_one(
+        page_num: int, col_num: int, csv_path: Path, rows: list[tuple[str, str]]
+    ) -> None:
         if not rows:
             console.log(f"Warning: no OCR rows for page {page_num} col {col_num}")
         else:
@@ -495,29 +542,50 @@ def ocr_columns(
             f"OCR page {page_num} col {col_num} -> {csv_path.name} ({len(rows)} rows)"
         )
 
-    if no_progress:
-        for page_num, col_num, path in selected:
-            process_one(page_num, col_num, path)
-        return
-
-    progress = Progress(
-        SpinnerColumn(),
-        TextColumn("{task.description}"),
-        BarColumn(),
-        TextColumn("{task.completed}/{task.total} columns"),
-        TimeElapsedColumn(),
-        TimeRemainingColumn(),
-        console=console,
-        transient=False,
-    )
+    paths = [path for _, _, path, _ in pending]
+    executor: ThreadPoolExecutor | None = None
+    if parallel:
+        # Each column is an independent set of tesseract runs and the
+        # workers mostly wait on those subprocesses, so threads are enough;
+        # results come back in order.
+        executor = ThreadPoolExecutor(max_workers=min(jobs, len(pending)))
+        results = executor.map(ocr_one, paths)
+    else:
+        results = map(ocr_one, paths)
 
-    with progress:
-        task_id = progress.add_task("OCR columns", total=len(selected))
-        for page_num, col_num, path in selected:
-            progress.update(
-                task_id, description=f"OCR page {page_num} col {col_num}"
+    try:
+        if no_progress:
+            for (page_num, col_num, _, csv_path), rows in zip(pending, results):
+                finish_one(page_num, col_num, csv_path, rows)
+        else:
+            progress = Progress(
+                SpinnerColumn(),
+                TextColumn("{task.description}"),
+                BarColumn(),
+                TextColumn("{task.completed}/{task.total} columns"),
+                TimeElapsedColumn(),
+                TimeRemainingColumn(),
+                console=console,
+                transient=False,
             )
-            process_one(page_num, col_num, path)
-            progress.advance(task_id)
+
+            with progress:
+                task_id = progress.add_task("OCR columns", total=len(pending))
+                for (page_num, col_num, _, csv_path), rows in zip(pending, results):
+                    progress.update(
+                        task_id, description=f"OCR page {page_num} col {col_num}"
+                    )
+                    finish_one(page_num, col_num, csv_path, rows)
+                    progress.advance(task_id)
+    except BaseException:
+        if executor is not None:
+            # map() has already queued every column; drop the ones not yet
+            # started so Ctrl-C or a write error stops the run right away.
+            executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    if executor is not None:
+        executor.shutdown()
+    if no_progress:
+        return
 
     console.log(f"Wrote OCR CSV for pages {start_page}-{end_page} to {out_dir}")
@@ -66,15 +66,18 @@ def pick_stable_start(centers: Sequence[int], spacing: float, min_len: int, tol:
         return centers[0]
     lo = spacing * (1.0 - tol)
     hi = spacing * (1.0 + tol)
-    for i in range(len(centers) - min_len + 1):
-        ok = True
-        for j in range(i, i + min_len - 1):
-            delta = centers[j + 1] - centers[j]
-            if delta < lo or delta > hi:
-                ok = False
-                break
-        if ok:
-            return centers[i]
+    need = min_len - 1
+    if need <= 0:
+        return centers[0]
+    run = 0
+    for j in range(len(centers) - 1):
+        delta = centers[j + 1] - centers[j]
+        if lo <= delta <= hi:
+            run += 1
+            if run >= need:
+                return centers[j + 1 - need]
+        else:
+            run = 0
     return centers[0]
 
 
@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import io
 import json
+import os
+import socket
 import threading
 import webbrowser
-from functools import partial
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import Any
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import unquote_plus, urlparse
 
 import jieba
 from rich.console import Console
@@ -17,86 +20,248 @@ from pycccedict.cccedict import CcCedict
 from mcc.merge import merge_csv
 from mcc.stats import collect_stats, update_readme_stats
 
+_CONTENT_TYPES = {
+    ".json": "application/json",
+    ".csv": "text/csv; charset=utf-8",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+}
 _README_STATS_LOCK = threading.Lock()
 _MERGE_LOCK = threading.Lock()
 _CCCEDICT_LOCK = threading.Lock()
-_CCCEDICT_WORDS: set[str] | None = None
+_CCCEDICT_WORDS: frozenset[str] | None = None
 _JIEBA_LOCK = threading.Lock()
 _JIEBA_READY = False
-_JIEBA_CACHE: dict[str, bool] = {}
 
 
-def _load_cccedict_words() -> set[str]:
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value).encode("utf-8")
+
+
+def _get_query(query: str, key: str) -> str | None:
+    # Same result as parse_qs(query).get(key, [None])[0] without building
+    # the full dict for the one or two keys each endpoint reads.
+    for part in query.split("&"):
+        name, sep, value = part.partition("=")
+        if not sep or not value:
+            continue
+        if name == key or unquote_plus(name) == key:
+            return unquote_plus(value)
+    return None
+
+
+def _load_cccedict_words() -> frozenset[str]:
     global _CCCEDICT_WORDS
-    if _CCCEDICT_WORDS is not None:
-        return _CCCEDICT_WORDS
+    words = _CCCEDICT_WORDS
+    if words is not None:
+        return words
     with _CCCEDICT_LOCK:
-        if _CCCEDICT_WORDS is not None:
-            return _CCCEDICT_WORDS
-        ccedict = CcCedict()
-        words: set[str] = set()
-        for entry in ccedict.get_entries():
-            simplified = entry.get("simplified")
-            traditional = entry.get("traditional")
-            if simplified:
-                words.add(simplified)
-            if traditional:
-                words.add(traditional)
+        words = _CCCEDICT_WORDS
+        if words is not None:
+            return words
+        entries = CcCedict().get_entries()
+        collected: set[str] = set()
+        collected.update(
+            entry["simplified"] for entry in entries if entry.get("simplified")
+        )
+        collected.update(
+            entry["traditional"] for entry in entries if entry.get("traditional")
+        )
+        words = frozenset(collected)
         _CCCEDICT_WORDS = words
-    return _CCCEDICT_WORDS
+    return words
 
 
-def _filter_missing_with_jieba(words: list[str]) -> list[str]:
+def _ensure_jieba_ready() -> None:
     global _JIEBA_READY
-    if not words:
-        return []
-    remaining: list[str] = []
-    to_check: list[str] = []
-    for word in words:
-        cached = _JIEBA_CACHE.get(word)
-        if cached is None:
-            to_check.append(word)
-        elif cached is False:
-            remaining.append(word)
-    if not to_check:
-        return remaining
+    if _JIEBA_READY:
+        return
     with _JIEBA_LOCK:
         if not _JIEBA_READY:
             jieba.initialize()
             _JIEBA_READY = True
-        for word in to_check:
-            cached = _JIEBA_CACHE.get(word)
-            if cached is None:
-                freq = jieba.get_FREQ(word)
-                cached = bool(freq) and freq > 0
-                _JIEBA_CACHE[word] = cached
-            if cached is False:
-                remaining.append(word)
-    return remaining
+
+
+@lru_cache(maxsize=None)
+def _jieba_has_word(word: str) -> bool:
+    freq = jieba.get_FREQ(word)
+    return bool(freq) and freq > 0
+
+
+def _filter_missing_with_jieba(words: list[str]) -> list[str]:
+    if not words:
+        return []
+    _ensure_jieba_ready()
+    return [word for word in words if not _jieba_has_word(word)]
+
+
+@lru_cache(maxsize=256)
+def _list_dir_payload(target: str, mtime_ns: int, exts: tuple[str, ...]) -> bytes:
+    # mtime_ns is part of the cache key so adding or removing files
+    # invalidates the cached listing.
+    files = []
+    for entry in Path(target).iterdir():
+        if not entry.is_file():
+            continue
+        if exts and entry.suffix.lower().lstrip(".") not in exts:
+            continue
+        files.append(entry.name)
+    return _json_dumps({"files": sorted(files)})
+
+
+def _warm_up_dictionaries() -> None:
+    try:
+        _load_cccedict_words()
+        _ensure_jieba_ready()
+    except Exception:
+        # Handlers retry the load lazily and report the failure per request.
+        pass
+
+
+def _resolve_under(root: str, raw_path: str, allowed: tuple[str, ...]) -> Path | None:
+    # Resolved on every call: symlinks under the repo can change while the
+    # server runs, so a cached answer could point outside the sandbox.
+    candidate = os.path.realpath(os.path.join(root, raw_path))
+    if not _is_within(candidate, root):
+        return None
+    if allowed and not any(_is_within(candidate, root_dir) for root_dir in allowed):
+        return None
+    return Path(candidate)
+
+
+class _ApiError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _is_within(path: str, root: str) -> bool:
+    if path == root:
+        return True
+    prefix = root if root.endswith(os.sep) else root + os.sep
+    return path.startswith(prefix)
+
+
+class ProofreadHTTPServer(ThreadingHTTPServer):
+    allow_reuse_address = True
+    # The default backlog of 5 drops connections when the app fetches many
+    # column images at once.
+    request_queue_size = 128
+
+    def __init__(self, *args: Any, max_workers: int = 32, **kwargs: Any) -> None:
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="proofread"
+        )
+        self._in_flight: dict[Future[None], socket.socket] = {}
+        self._in_flight_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def process_request(
+        self, request: socket.socket, client_address: tuple[str, int]
+    ) -> None:
+        # Reuse a bounded set of worker threads instead of starting one
+        # thread per connection.
+        future = self._pool.submit(
+            self.process_request_thread, request, client_address
+        )
+        with self._in_flight_lock:
+            self._in_flight[future] = request
+        future.add_done_callback(self._forget_request)
+
+    def _forget_request(self, future: Future[None]) -> None:
+        with self._in_flight_lock:
+            self._in_flight.pop(future, None)
+
+    def server_close(self) -> None:
+        super().server_close()
+        # Pool workers are not daemon threads, so shutdown must not wait on
+        # idle keep-alive connections: queued requests are dropped and the
+        # read side of running ones is closed so their handlers see EOF.
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        with self._in_flight_lock:
+            in_flight = list(self._in_flight.items())
+        for future, request in in_flight:
+            if future.cancelled():
+                self.shutdown_request(request)
+                continue
+            try:
+                request.shutdown(socket.SHUT_RD)
+            except OSError:
+                pass
 
 
 class ProofreadRequestHandler(SimpleHTTPRequestHandler):
+    # Idle connections (e.g. browser preconnects) must not pin a pool worker.
+    timeout = 30
+
     def __init__(
         self,
         *args: Any,
         directory: str | None = None,
         config: dict[str, str] | None = None,
+        config_payload: bytes | None = None,
         repo_root: Path | None = None,
         allowed_read_dirs: list[Path] | None = None,
         allowed_write_dirs: list[Path] | None = None,
         **kwargs: Any,
     ) -> None:
         self._config = config or {}
+        if config_payload is None:
+            config_payload = _json_dumps(self._config)
+        self._config_payload = config_payload
         self._repo_root = repo_root
         self._allowed_read_dirs = allowed_read_dirs or []
         self._allowed_write_dirs = allowed_write_dirs or []
+        # Roots are expected to be resolved already; plain string checks keep
+        # per-request path validation to one realpath call.
+        self._repo_root_str = os.fspath(repo_root) if repo_root is not None else None
+        self._allowed_read_strs = tuple(map(os.fspath, self._allowed_read_dirs))
+        self._allowed_write_strs = tuple(map(os.fspath, self._allowed_write_dirs))
+        self._etag: str | None = None
         super().__init__(*args, directory=directory, **kwargs)
 
+    def send_head(self):
+        self._etag = None
+        path = self.translate_path(self.path)
+        if urlparse(self.path).path.endswith("/") or not os.path.isfile(path):
+            return super().send_head()
+        try:
+            st = os.stat(path)
+        except OSError:
+            return super().send_head()
+        etag = f'"{st.st_size:x}-{st.st_mtime_ns:x}"'
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match:
+            tags = {tag.strip() for tag in if_none_match.split(",")}
+            if etag in tags or "*" in tags:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return None
+        self._etag = etag
+        return super().send_head()
+
+    def send_error(
+        self, code: int, message: str | None = None, explain: str | None = None
+    ) -> None:
+        # The ETag describes the file send_head was about to serve; it must
+        # not be attached to an error page if opening that file failed.
+        self._etag = None
+        super().send_error(code, message, explain)
+
+    def end_headers(self) -> None:
+        if self._etag is not None:
+            self.send_header("ETag", self._etag)
+            self._etag = None
+        super().end_headers()
+
     def do_GET(self) -> None:  # noqa: N802 - upstream method name
         parsed = urlparse(self.path)
         path = parsed.path
         if path == "/config.json":
-            payload = json.dumps(self._config).encode("utf-8")
+            payload = self._config_payload
             self.send_response(200)
             self.send_header("Content-Type", "application/json")
             self.send_header("Content-Length", str(len(payload)))
@@ -127,25 +292,13 @@ class ProofreadRequestHandler(SimpleHTTPRequestHandler):
 
     def _handle_api_get(self, parsed) -> bool:
         if parsed.path == "/api/list":
-            params = parse_qs(parsed.query)
-            dir_value = params.get("dir", [None])[0]
-            ext_value = params.get("ext", [""])[0]
-            if not dir_value:
-                self.send_error(400, "Missing dir parameter")
-                return True
-            target = self._resolve_path(dir_value, allow_write=False)
-            if not target or not target.is_dir():
-                self.send_error(404, "Directory not found")
+            try:
+                payload = self._list_files(
+                    _get_query(parsed.query, "dir"), _get_query(parsed.query, "ext")
+                )
+            except _ApiError as exc:
+                self.send_error(exc.status, exc.message)
                 return True
-            exts = [ext.strip().lower() for ext in ext_value.split(",") if ext.strip()]
-            files = []
-            for entry in target.iterdir():
-                if not entry.is_file():
-                    continue
-                if exts and entry.suffix.lower().lstrip(".") not in exts:
-                    continue
-                files.append(entry.name)
-            payload = json.dumps({"files": sorted(files)}).encode("utf-8")
             self.send_response(200)
             self.send_header("Content-Type", "application/json")
             self.send_header("Content-Length", str(len(payload)))
@@ -153,36 +306,49 @@ class ProofreadRequestHandler(SimpleHTTPRequestHandler):
             self.wfile.write(payload)
             return True
         if parsed.path in {"/api/read", "/api/file"}:
-            params = parse_qs(parsed.query)
-            path_value = params.get("path", [None])[0]
-            if not path_value:
-                self.send_error(400, "Missing path parameter")
-                return True
-            target = self._resolve_path(path_value, allow_write=False)
-            if not target or not target.is_file():
-                self.send_error(404, "File not found")
+            try:
+                target, content_type = self._resolve_read_target(
+                    _get_query(parsed.query, "path")
+                )
+            except _ApiError as exc:
+                self.send_error(exc.status, exc.message)
                 return True
-            data = target.read_bytes()
-            content_type = "application/octet-stream"
-            if target.suffix.lower() == ".json":
-                content_type = "application/json"
-            elif target.suffix.lower() == ".csv":
-                content_type = "text/csv; charset=utf-8"
-            elif target.suffix.lower() in {".png"}:
-                content_type = "image/png"
-            elif target.suffix.lower() in {".jpg", ".jpeg"}:
-                content_type = "image/jpeg"
-            self.send_response(200)
-            self.send_header("Content-Type", content_type)
-            self.send_header("Content-Length", str(len(data)))
-            self.end_headers()
-            self.wfile.write(data)
+            with target.open("rb") as file:
+                size = os.fstat(file.fileno()).st_size
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(size))
+                self.end_headers()
+                # socket.sendfile uses os.sendfile where available and falls
+                # back to a send() loop elsewhere.
+                self.connection.sendfile(file, 0, size)
             return True
         return False
 
+    def _list_files(self, dir_value: str | None, ext_value: str | None) -> bytes:
+        if not dir_value:
+            raise _ApiError(400, "Missing dir parameter")
+        target = self._resolve_path(dir_value, allow_write=False)
+        if not target or not target.is_dir():
+            raise _ApiError(404, "Directory not found")
+        exts = tuple(
+            ext.strip().lower() for ext in (ext_value or "").split(",") if ext.strip()
+        )
+        return _list_dir_payload(str(target), target.stat().st_mtime_ns, exts)
+
+    def _resolve_read_target(self, path_value: str | None) -> tuple[Path, str]:
+        if not path_value:
+            raise _ApiError(400, "Missing path parameter")
+        target = self._resolve_path(path_value, allow_write=False)
+        if not target or not target.is_file():
+            raise _ApiError(404, "File not found")
+        content_type = _CONTENT_TYPES.get(
+            target.suffix.lower(), "application/octet-stream"
+        )
+        return target, content_type
+
     def _handle_api_write(self, parsed) -> None:
-        params = parse_qs(parsed.query)
-        path_value = params.get("path", [None])[0]
+        path_value = _get_query(parsed.query, "path")
         if not path_value:
             self.send_error(400, "Missing path parameter")
             return
@@ -214,7 +380,7 @@ class ProofreadRequestHandler(SimpleHTTPRequestHandler):
             return
 
         if not _README_STATS_LOCK.acquire(blocking=False):
-            payload = json.dumps({"status": "busy"}).encode("utf-8")
+            payload = _json_dumps({"status": "busy"})
             self.send_response(202)
             self.send_header("Content-Type", "application/json")
             self.send_header("Content-Length", str(len(payload)))
@@ -235,7 +401,7 @@ class ProofreadRequestHandler(SimpleHTTPRequestHandler):
         finally:
             _README_STATS_LOCK.release()
 
-        payload = json.dumps({"status": "ok"}).encode("utf-8")
+        payload = _json_dumps({"status": "ok"})
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(payload)))
@@ -262,7 +428,7 @@ class ProofreadRequestHandler(SimpleHTTPRequestHandler):
             return
 
         if not _MERGE_LOCK.acquire(blocking=False):
-            payload = json.dumps({"status": "busy"}).encode("utf-8")
+            payload = _json_dumps({"status": "busy"})
             self.send_response(202)
             self.send_header("Content-Type", "application/json")
             self.send_header("Content-Length", str(len(payload)))
@@ -286,7 +452,7 @@ class ProofreadRequestHandler(SimpleHTTPRequestHandler):
         finally:
             _MERGE_LOCK.release()
 
-        payload = json.dumps({"status": "ok"}).encode("utf-8")
+        payload = _json_dumps({"status": "ok"})
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(payload)))
@@ -301,62 +467,48 @@ class ProofreadRequestHandler(SimpleHTTPRequestHandler):
         except json.JSONDecodeError:
             self.send_error(400, "Invalid JSON payload")
             return
-        words = payload.get("words")
-        if not isinstance(words, list):
-            self.send_error(400, "Missing words list")
+        try:
+            missing = self._find_missing_words(payload.get("words"))
+        except _ApiError as exc:
+            self.send_error(exc.status, exc.message)
             return
-        normalized: set[str] = set()
-        for word in words:
-            if word is None:
-                continue
-            text = str(word).strip()
-            if text:
-                normalized.add(text)
+        response = _json_dumps({"missing": missing})
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def _find_missing_words(self, words: Any) -> list[str]:
+        if not isinstance(words, list):
+            raise _ApiError(400, "Missing words list")
+        stripped = (str(word).strip() for word in words if word is not None)
+        normalized = {text for text in stripped if text}
         if not normalized:
-            response = json.dumps({"missing": []}).encode("utf-8")
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.send_header("Content-Length", str(len(response)))
-            self.end_headers()
-            self.wfile.write(response)
-            return
+            return []
         try:
             ccedict_words = _load_cccedict_words()
         except Exception:
-            self.send_error(500, "Failed to load CC-CEDICT")
-            return
-        missing = sorted(normalized.difference(ccedict_words))
+            raise _ApiError(500, "Failed to load CC-CEDICT") from None
+        missing = [word for word in normalized if word not in ccedict_words]
         if missing:
             try:
                 missing = _filter_missing_with_jieba(missing)
             except Exception:
-                self.send_error(500, "Failed to load Jieba dictionary")
-                return
-        response = json.dumps({"missing": missing}).encode("utf-8")
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(response)))
-        self.end_headers()
-        self.wfile.write(response)
+                raise _ApiError(500, "Failed to load Jieba dictionary") from None
+            missing.sort()
+        return missing
 
     def _resolve_repo_path(self, raw_path: str) -> Path | None:
-        if self._repo_root is None:
-            return None
-        candidate = (self._repo_root / raw_path).resolve()
-        if not candidate.is_relative_to(self._repo_root):
+        if self._repo_root_str is None:
             return None
-        return candidate
+        return _resolve_under(self._repo_root_str, raw_path, ())
 
     def _resolve_path(self, raw_path: str, *, allow_write: bool) -> Path | None:
-        if self._repo_root is None:
-            return None
-        candidate = (self._repo_root / raw_path).resolve()
-        if not candidate.is_relative_to(self._repo_root):
+        if self._repo_root_str is None:
             return None
-        allowed = self._allowed_write_dirs if allow_write else self._allowed_read_dirs
-        if allowed and not any(candidate.is_relative_to(root) for root in allowed):
-            return None
-        return candidate
+        allowed = self._allowed_write_strs if allow_write else self._allowed_read_strs
+        return _resolve_under(self._repo_root_str, raw_path, allowed)
 
 
 def run_proofread_server(
@@ -369,6 +521,7 @@ def run_proofread_server(
     if not web_root.exists():
         raise SystemExit(f"Web assets not found at {web_root}")
 
+    repo_root = repo_root.resolve()
     config = {
         "default_post_dir": "post",
         "default_csv_dir": "post/csv",
@@ -379,17 +532,19 @@ def run_proofread_server(
         "server_mode": True,
     }
 
+    threading.Thread(target=_warm_up_dictionaries, daemon=True).start()
+
     handler = partial(
         ProofreadRequestHandler,
         directory=str(web_root),
         config=config,
+        config_payload=_json_dumps(config),
         repo_root=repo_root,
         allowed_read_dirs=[repo_root / "post", repo_root / "pre"],
         allowed_write_dirs=[repo_root / "post"],
     )
 
-    ThreadingHTTPServer.allow_reuse_address = True
-    server = ThreadingHTTPServer((host, port), handler)
+    server = ProofreadHTTPServer((host, port), handler)
     url = f"http://{host}:{server.server_address[1]}/"
     print(f"Proofread app running at {url}")
     if open_browser:
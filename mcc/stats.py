@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
@@ -42,38 +46,17 @@ def compute_row_ranges(
 
     row_ranges_by_pass: dict[str, list[int | list[int]]] = {}
     unproofread_ranges: list[int | list[int]] = []
-    current_pass: int | None = None
-    current_start: int | None = None
-    row_cursor = 1
 
-    for item in items:
-        row_count = len(item.rows)
-        if row_count == 0:
-            continue
-        pass_num = extract_pass(item.meta)
-        if current_start is None:
-            current_start = row_cursor
-            current_pass = pass_num
-        elif pass_num != current_pass:
-            end = row_cursor - 1
-            if current_pass is None:
-                append_range(unproofread_ranges, current_start, end)
-            else:
-                pass_key = str(current_pass)
-                row_ranges_by_pass.setdefault(pass_key, [])
-                append_range(row_ranges_by_pass[pass_key], current_start, end)
-            current_start = row_cursor
-            current_pass = pass_num
-        row_cursor += row_count
-
-    if current_start is not None:
+    counted = [(extract_pass(item.meta), len(item.rows)) for item in items if item.rows]
+    row_cursor = 1
+    for pass_num, group in groupby(counted, key=itemgetter(0)):
+        start = row_cursor
+        row_cursor += sum(row_count for _, row_count in group)
         end = row_cursor - 1
-        if current_pass is None:
-            append_range(unproofread_ranges, current_start, end)
+        if pass_num is None:
+            append_range(unproofread_ranges, start, end)
         else:
-            pass_key = str(current_pass)
-            row_ranges_by_pass.setdefault(pass_key, [])
-            append_range(row_ranges_by_pass[pass_key], current_start, end)
+            append_range(row_ranges_by_pass.setdefault(str(pass_num), []), start, end)
 
     return row_ranges_by_pass, unproofread_ranges
 
@@ -93,23 +76,25 @@ def collect_stats(
         console.log(f"Metadata directory not found: {meta_dir}. Proceeding without metadata.")
         meta_dir = None
 
-    merge_items: list[MergeItem] = []
-    for page_num, col_num, path in items:
-        rows = read_csv_rows(path)
+    def load_item(item: tuple[int, int, Path]) -> MergeItem:
+        page_num, col_num, path = item
         base = path.stem
-        meta = read_metadata(meta_dir, base)
-        merge_items.append(
-            MergeItem(
-                page=page_num,
-                col=col_num,
-                path=path,
-                base=base,
-                rows=rows,
-                columns=[],
-                meta=meta,
-            )
+        return MergeItem(
+            page=page_num,
+            col=col_num,
+            path=path,
+            base=base,
+            rows=read_csv_rows(path),
+            columns=[],
+            meta=read_metadata(meta_dir, base),
         )
 
+    # Each column is a small CSV plus an optional JSON sidecar; reading them
+    # on a thread pool overlaps the file I/O. map() keeps page/column order.
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        merge_items = list(executor.map(load_item, items))
+
     row_ranges_by_pass, unproofread_ranges = compute_row_ranges(merge_items)
     return build_stats(merge_items, row_ranges_by_pass, unproofread_ranges)
 
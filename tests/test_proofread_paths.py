@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from mcc.proofread.server import _is_within, _resolve_under
+
+
+class TestResolveUnder(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        base = os.path.realpath(tmpdir.name)
+        self.root = os.path.join(base, "repo")
+        self.post = os.path.join(self.root, "post")
+        os.makedirs(self.post)
+        os.makedirs(os.path.join(self.root, "post2"))
+        self.outside = os.path.join(base, "outside.txt")
+        Path(self.outside).write_text("secret", encoding="utf-8")
+
+    def test_path_inside_root(self) -> None:
+        self.assertEqual(
+            _resolve_under(self.root, "post/a.csv", ()),
+            Path(self.post) / "a.csv",
+        )
+
+    def test_root_itself(self) -> None:
+        self.assertEqual(_resolve_under(self.root, ".", ()), Path(self.root))
+        self.assertEqual(_resolve_under(self.root, "", ()), Path(self.root))
+        self.assertEqual(
+            _resolve_under(self.root, "post", (self.post,)), Path(self.post)
+        )
+
+    def test_parent_traversal(self) -> None:
+        self.assertIsNone(_resolve_under(self.root, "..", ()))
+        self.assertIsNone(_resolve_under(self.root, "../outside.txt", ()))
+        self.assertIsNone(_resolve_under(self.root, "post/../../outside.txt", ()))
+
+    def test_absolute_path(self) -> None:
+        self.assertIsNone(_resolve_under(self.root, self.outside, ()))
+        self.assertIsNone(_resolve_under(self.root, "/etc/passwd", ()))
+
+    def test_symlink_escape(self) -> None:
+        link = os.path.join(self.post, "link.txt")
+        os.symlink(self.outside, link)
+        self.assertIsNone(_resolve_under(self.root, "post/link.txt", ()))
+
+    def test_symlink_replaced_after_first_resolve(self) -> None:
+        target = os.path.join(self.post, "s.txt")
+        self.assertEqual(_resolve_under(self.root, "post/s.txt", ()), Path(target))
+        os.symlink(self.outside, target)
+        self.assertIsNone(_resolve_under(self.root, "post/s.txt", ()))
+
+    def test_sibling_prefix_dir(self) -> None:
+        self.assertIsNone(_resolve_under(self.root, "post2/a.csv", (self.post,)))
+        self.assertEqual(
+            _resolve_under(self.root, "post/a.csv", (self.post,)),
+            Path(self.post) / "a.csv",
+        )
+
+    def test_is_within(self) -> None:
+        self.assertTrue(_is_within(self.root, self.root))
+        self.assertTrue(_is_within(self.post, self.root))
+        self.assertFalse(_is_within(self.root + "2", self.root))
+        self.assertFalse(_is_within(os.path.dirname(self.root), self.root))
+
+
+if __name__ == "__main__":
+    unittest.main()